@@ -1,5 +1,6 @@
-from .generator import generate
+from .generator import generate, generate_many
+from .core import preload_metadata
 
 __version__ = "1.5.1"
 
-__all__ = ['generate', '__version__']
+__all__ = ['generate', 'generate_many', 'preload_metadata', '__version__']
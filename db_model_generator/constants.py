@@ -209,3 +209,98 @@ LANGUAGES_RU = {
     "yo": "йоруба (Yorùbá)",
     "zu": "зулу (isiZulu)"
 }
+
+# SQL тип колонки -> тип SQLAlchemy (без префикса db.)
+SQLALCHEMY_TYPES = {
+    'integer': 'Integer',
+    'float': 'Float',
+    'numeric': 'Float',
+    'boolean': 'Boolean',
+    'datetime': 'DateTime',
+    'date': 'Date'
+}
+
+# SQL типы, для которых в модели указывается длина строки
+STRING_SQL_TYPES = frozenset({'string', 'text'})
+
+# Префиксы имен строковых типов, которые при рефлексии приводятся к 'string'
+STRING_TYPE_PREFIXES = ('varchar', 'nvarchar', 'char', 'nchar')
+
+# Google Translate принимает текст одного запроса строго короче этой длины
+TRANSLATE_MAX_LENGTH = 5000
+
+# SQL тип колонки -> ключ в form.field_mapping конфигурации
+WTFORMS_FIELD_KEYS = {
+    'string': 'string',
+    'text': 'text',
+    'integer': 'integer',
+    'float': 'float',
+    'numeric': 'float',
+    'boolean': 'boolean',
+    'datetime': 'datetime',
+    'date': 'date'
+}
+
+# Базовые настройки модели для Flask-SQLAlchemy
+MODEL_CONFIG = {
+    "base_class": "db.Model",
+    "imports": [
+        "from flask_sqlalchemy import SQLAlchemy",
+        "from datetime import datetime",
+    ],
+    "exclude_columns": ["created_at", "updated_at"],
+    "type_mapping": {
+        "string": "db.String",
+        "text": "db.Text",
+        "integer": "db.Integer",
+        "float": "db.Float",
+        "boolean": "db.Boolean",
+        "datetime": "db.DateTime",
+        "date": "db.Date"
+    }
+}
+
+# Базовые настройки модели для классического SQLAlchemy
+CLASSIC_MODEL_CONFIG = {
+    "base_class": "Base",
+    "imports": [
+        "from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, Float",
+        "from sqlalchemy.ext.declarative import declarative_base",
+        "",
+        "Base = declarative_base()"
+    ],
+    "exclude_columns": ["id", "created_at", "updated_at"],
+    "type_mapping": {
+        "string": "String",
+        "text": "Text",
+        "integer": "Integer",
+        "float": "Float",
+        "boolean": "Boolean",
+        "datetime": "DateTime",
+        "date": "Date"
+    }
+}
+
+# Базовые настройки формы WTForms
+FORM_CONFIG = {
+    "base_class": "FlaskForm",
+    "imports": [
+        "from flask_wtf import FlaskForm",
+        "from wtforms import StringField, TextAreaField, IntegerField, FloatField, BooleanField, DateField, DateTimeField, SelectField, SubmitField",
+        "from wtforms.validators import DataRequired, Email, Length, NumberRange"
+    ],
+    "field_mapping": {
+        "string": "StringField",
+        "text": "TextAreaField",
+        "integer": "IntegerField",
+        "float": "FloatField",
+        "boolean": "BooleanField",
+        "datetime": "DateTimeField",
+        "date": "DateField"
+    },
+    "default_validators": {
+        "required": "DataRequired()",
+        "email": "Email()"
+    },
+    "meta": {}
+}
@@ -1,19 +1,86 @@
-import json
-from dataclasses import dataclass
+import re
+from copy import deepcopy
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
+from threading import Lock, local
+from typing import TYPE_CHECKING, TextIO
 from warnings import warn
 
-import requests
-from dotenv import dotenv_values
-from deep_translator import GoogleTranslator
-from tab4 import tab4
-from sqlalchemy import create_engine, MetaData, Table, inspect
-from sqlalchemy.types import String, Integer, Float, Text, Boolean, DateTime, Date
+from jinja2 import Environment as JinjaEnvironment, PackageLoader
+from sqlalchemy import create_engine, DefaultClause, Engine, MetaData, Table
 from pyundefined import undefined
 from urllib.parse import urlparse
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+from db_model_generator.constants import (MODEL_CONFIG, CLASSIC_MODEL_CONFIG, FORM_CONFIG, SQLALCHEMY_TYPES,
+                                          STRING_SQL_TYPES, STRING_TYPE_PREFIXES, TRANSLATE_MAX_LENGTH,
+                                          WTFORMS_FIELD_KEYS)
 from db_model_generator.typings import *
-from db_model_generator.warnings import MeaninglessArgumentWarning
+from db_model_generator.warnings import MeaninglessArgumentWarning, EmptyClassWarning
+
+if TYPE_CHECKING:
+    from deep_translator import GoogleTranslator
+
+# Шаблоны компилируются один раз и переиспользуются всеми генераторами
+_jinja_env = JinjaEnvironment(
+    loader=PackageLoader('db_model_generator'),
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True
+)
+
+# Поля с email в имени получают валидатор Email()
+_EMAIL_RE = re.compile('email', re.IGNORECASE)
+
+# Первый символ имени и каждого слова после "_" для перевода snake_case в CamelCase
+_CAMEL_RE = re.compile(r'(?:^|_)([^_])')
+
+
+def _split_labels(labels: list[str], max_length: int):
+    """Делит labels на части, каждая из которых после объединения через перевод строки короче max_length"""
+    chunk, length = [], -1
+    for label in labels:
+        if chunk and length + 1 + len(label) >= max_length:
+            yield chunk
+            chunk, length = [], -1
+        chunk.append(label)
+        length += 1 + len(label)
+    if chunk:
+        yield chunk
+
+
+def check_database_url(url: str) -> str:
+    """Проверяет URL базы данных до подключения, чтобы SQLAlchemy не создала пустой файл SQLite"""
+    if not url:
+        raise ValueError('database_url is required')
+    if url.startswith('sqlite:///'):
+        path = url.replace('sqlite:///', '')
+        if not Path(path).exists():
+            raise FileNotFoundError('SQLite database does not exist')
+    return url
+
+
+@lru_cache(maxsize=8)
+def get_engine(database_url: str) -> Engine:
+    """Возвращает движок SQLAlchemy для URL, создавая его только при первом обращении"""
+    return create_engine(database_url, pool_pre_ping=True)
+
+
+def preload_metadata(database_url: str, table_names: list[str]) -> MetaData:
+    """Отражает несколько таблиц и представлений одним вызовом. Генераторы, получившие результат
+    в параметре metadata, читают колонки этих таблиц без запросов к БД"""
+    metadata = MetaData()
+    metadata.reflect(bind=get_engine(database_url), only=list(table_names), views=True)
+    return metadata
 
 
 @dataclass
@@ -80,10 +147,46 @@ class Code:
         return iter((self.code, self.class_name))
 
 
+@dataclass
+class ColumnsInfo:
+    """Информация о колонках таблицы в виде параллельных списков"""
+    names: list[str] = field(default_factory=list)
+    types: list[str] = field(default_factory=list)
+    nullables: list[bool] = field(default_factory=list)
+    defaults: list = field(default_factory=list)
+    primary_keys: list[bool] = field(default_factory=list)
+    lengths: list[Optional[int]] = field(default_factory=list)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        """Перебирает колонки кортежами (name, type, nullable, default, primary_key, length)"""
+        return zip(self.names, self.types, self.nullables, self.defaults, self.primary_keys, self.lengths)
+
+    def append(self, name: str, column_type, nullable: bool, default, primary_key: bool):
+        """Добавляет колонку, приводя ее тип SQLAlchemy к имени типа"""
+        type_name = type(column_type).__name__.lower()
+        if type_name.startswith(STRING_TYPE_PREFIXES):
+            type_name = 'string'
+        self.names.append(name)
+        self.types.append(type_name)
+        self.nullables.append(nullable)
+        self.defaults.append(default)
+        self.primary_keys.append(primary_key)
+        self.lengths.append(getattr(column_type, 'length', None))
+
+
 class ModelFormGenerator:
     """Генератор моделей и форм на основе таблиц БД"""
 
-    _translator: Optional[GoogleTranslator] = None
+    # GoogleTranslator хранит параметры запроса в себе, поэтому у каждого потока свои переводчики
+    _translators = local()
+    _translation_cache: dict[tuple[str, str], dict[str, str]] = {}
+    _config_file_cache: dict[tuple[str, int], dict] = {}
+    _env_file_cache: dict[tuple[str, int], dict] = {}
+    # Общий кэш переводов используется из нескольких потоков в generate_many
+    _translation_lock = Lock()
     environment: Environment
     __NON_REWRITABLE_DECORATOR: str = '# @non-rewritable'
 
@@ -106,13 +209,17 @@ class ModelFormGenerator:
          non_rewritable: NullBool = None,
          ignore_and_rewrite: NullBool = None,
          add_db_to_all: NullBool = None,
-         colon_to_labels: NullBool = None
+         colon_to_labels: NullBool = None,
+         output_dir: PathLikeOrNone = None,
+         metadata: Optional[MetaData] = None
     ):
+        # Папка для файла с именем по умолчанию, явно заданный output_path ее не учитывает
+        self._output_dir = output_dir
         self._init_environment(env)
         if not config_path:
             config_path = self.environment.config_path
         self.config = self._load_config(config_path)
-        self._init_main_args(self.__format_kwargs(
+        self._init_main_args(
             database_url=database_url,
             table_name=table_name,
             default_rename=default_rename,
@@ -129,34 +236,56 @@ class ModelFormGenerator:
             ignore_and_rewrite=ignore_and_rewrite,
             add_db_to_all=add_db_to_all,
             colon_to_labels=colon_to_labels
-        ))
-        self.engine = create_engine(self.database_url)
-        self.metadata = MetaData()
+        )
+        # Для классического SQLAlchemy используем Column вместо db.Column, String вместо db.String и т.д.
+        self._db_prefix = '' if self.classic_sqlalchemy else 'db.'
+        # Таблицы соответствия типов строятся один раз, для каждой колонки остается один поиск в словаре
+        self._sa_type_table = {sql_type: self._db_prefix + sqlalchemy_type
+                               for sql_type, sqlalchemy_type in SQLALCHEMY_TYPES.items()}
+        field_mapping = self.config["form"]["field_mapping"]
+        self._wt_type_table = {sql_type: field_mapping[key] for sql_type, key in WTFORMS_FIELD_KEYS.items()}
+        self.engine = get_engine(self.database_url)
+        # Заранее отраженные таблицы (preload_metadata), остальные отражаются при генерации
+        self.metadata = metadata if metadata is not None else MetaData()
+        self._columns_info_cache: dict[str, ColumnsInfo] = {}
+        self._model_template = _jinja_env.get_template('model.jinja')
+        self._form_template = _jinja_env.get_template('form.jinja')
 
     def _init_environment(self, env_path: PathLikeOrNone = None):
         if env_path is not undefined:
-            env = dict(dotenv_values(env_path))
-            lower_dict = dict()
-            for key, value in env.items():
-                if isinstance(value, str):
-                    if value.lower() == 'true' or value == '1':
-                        value = True
-                    elif value.lower() == 'false' or value == '0':
-                        value = False
-                lower_dict[key.lower()] = value
-            lower_dict = self.__fix_args_keys(lower_dict)
-            self.environment = Environment(**lower_dict)
+            self.environment = Environment(**self._read_env_file(env_path))
         else:
             self.environment = Environment()
 
+    @classmethod
+    def _read_env_file(cls, env_path: PathLikeOrNone = None) -> dict:
+        """Читает .env файл: ключи приводятся к нижнему регистру, true/false/1/0 к bool"""
+        key = None
+        if env_path and Path(env_path).is_file():
+            path = Path(env_path)
+            key = (str(path.resolve()), path.stat().st_mtime_ns)
+            env = cls._env_file_cache.get(key)
+            if env is not None:
+                return dict(env)
+
+        from dotenv import dotenv_values
+        env = dict()
+        for name, value in dotenv_values(env_path).items():
+            if isinstance(value, str):
+                if value.lower() == 'true' or value == '1':
+                    value = True
+                elif value.lower() == 'false' or value == '0':
+                    value = False
+            env[name.lower()] = value
+        env = cls.__fix_args_keys(env)
+        if key is not None:
+            cls._env_file_cache[key] = env
+        return dict(env)
+
     def log(self, *values: str, sep: str = ' ', end: str = '\n', file=None, flush: bool = False):
         if self.log_mode:
             print(*values, sep=sep, end=end, file=file, flush=flush)
 
-    @staticmethod
-    def __format_kwargs(**kwargs) -> dict:
-        return {key: value for key, value in kwargs.items() if value is not None}
-
     def __output_path(self, path: PathLikeOrNone = None) -> Path:
         if path:
             return Path(path)
@@ -166,17 +295,11 @@ class ModelFormGenerator:
             suffix = '_form'
         else:
             suffix = ''
-        return Path(self.table_name + suffix + '.py')
+        return Path(self._output_dir or '', self.table_name + suffix + '.py')
 
     @staticmethod
     def __database_url(url: str) -> str:
-        if not url:
-            raise ValueError('database_url is required')
-        if url.startswith('sqlite:///'):
-            path = url.replace('sqlite:///', '')
-            if not Path(path).exists():
-                raise FileNotFoundError('SQLite database does not exist')
-        return url
+        return check_database_url(url)
 
     @staticmethod
     def __table_name(table_name: str) -> str:
@@ -184,12 +307,11 @@ class ModelFormGenerator:
             raise ValueError('table_name is required')
         return table_name
 
-    def _init_main_args(self, kwargs):
+    def _init_main_args(self, **kwargs):
         """Инициализирует основные аргументы до загрузки конфигурации"""
         args = self.config['arguments']
-        for key, value in kwargs.items():
-            if value:
-                args[key] = value
+        # Незаданные (None) и ложные значения не перекрывают конфигурацию
+        args.update((key, value) for key, value in kwargs.items() if value)
         self.database_url = self.__database_url(args['database_url'])
         self.table_name = self.__table_name(args['table_name'])
         self.default_rename = args['default_rename']
@@ -207,15 +329,27 @@ class ModelFormGenerator:
         self.add_db_to_all = args['add_db_to_all']
         self.colon_to_labels = args['colon_to_labels']
 
-    @staticmethod
-    def __get_classic_sqlalchemy(default, config_path: PathLikeOrNone = None) -> bool:
-        if config_path and Path(config_path).exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                try:
-                    return json.load(f)['arguments']['classic_sqlalchemy']
-                except KeyError:
-                    pass
-        return default['arguments']['classic_sqlalchemy']
+    @classmethod
+    def _get_translator(cls, source: str, target: str) -> 'GoogleTranslator':
+        """Возвращает переводчик на пару языков для текущего потока, создавая его при первом обращении"""
+        cache = getattr(cls._translators, 'cache', None)
+        if cache is None:
+            cache = cls._translators.cache = {}
+        translator = cache.get((source, target))
+        if translator is None:
+            from deep_translator import GoogleTranslator
+            translator = cache[(source, target)] = GoogleTranslator(source=source, target=target)
+        return translator
+
+    @classmethod
+    def _read_config_file(cls, config_path: PathLike) -> dict:
+        """Читает JSON файл конфигурации, уже разобранные файлы берутся из кэша"""
+        path = Path(config_path)
+        key = (str(path.resolve()), path.stat().st_mtime_ns)
+        config = cls._config_file_cache.get(key)
+        if config is None:
+            config = cls._config_file_cache[key] = _json.loads(path.read_bytes())
+        return deepcopy(config)
 
     @staticmethod
     def __is_url(string: str) -> bool:
@@ -227,47 +361,21 @@ class ModelFormGenerator:
 
     def _load_config(self, config_path):
         """Загружает конфигурацию из JSON файла"""
-        # Базовые настройки для Flask-SQLAlchemy
+        # Пользовательская конфигурация разбирается один раз
+        user_config = None
+        if config_path:
+            if self.__is_url(config_path):
+                import requests
+                response = requests.get(config_path)
+                if response.ok:
+                    user_config = _json.loads(response.content)
+            else:
+                try:
+                    user_config = self._read_config_file(config_path)
+                except FileNotFoundError:
+                    warn("Конфигурационного файла не существует", UserWarning, 3)
+
         default_config = {
-            "model": {
-                "base_class": "db.Model",
-                "imports": [
-                    "from flask_sqlalchemy import SQLAlchemy",
-                    "from datetime import datetime",
-                ],
-                "exclude_columns": ["created_at", "updated_at"],
-                "type_mapping": {
-                    "string": "db.String",
-                    "text": "db.Text",
-                    "integer": "db.Integer",
-                    "float": "db.Float",
-                    "boolean": "db.Boolean",
-                    "datetime": "db.DateTime",
-                    "date": "db.Date"
-                }
-            },
-            "form": {
-                "base_class": "FlaskForm",
-                "imports": [
-                    "from flask_wtf import FlaskForm",
-                    "from wtforms import StringField, TextAreaField, IntegerField, FloatField, BooleanField, DateField, DateTimeField, SelectField, SubmitField",
-                    "from wtforms.validators import DataRequired, Email, Length, NumberRange"
-                ],
-                "field_mapping": {
-                    "string": "StringField",
-                    "text": "TextAreaField",
-                    "integer": "IntegerField",
-                    "float": "FloatField",
-                    "boolean": "BooleanField",
-                    "datetime": "DateTimeField",
-                    "date": "DateField"
-                },
-                "default_validators": {
-                    "required": "DataRequired()",
-                    "email": "Email()"
-                },
-                "meta": {}
-            },
             "arguments": {
                 "database_url": self.environment.database_url,
                 "table_name": self.environment.table_name,
@@ -288,40 +396,21 @@ class ModelFormGenerator:
             }
         }
 
-        # Если используется классический SQLAlchemy, меняем настройки
-        if getattr(self, 'classic_sqlalchemy',
-                                     self.__get_classic_sqlalchemy(default_config, config_path)):
-            default_config["model"] = {
-                "base_class": "Base",
-                "imports": [
-                    "from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, Float",
-                    "from sqlalchemy.ext.declarative import declarative_base",
-                    "",
-                    "Base = declarative_base()"
-                ],
-                "exclude_columns": ["id", "created_at", "updated_at"],
-                "type_mapping": {
-                    "string": "String",
-                    "text": "Text",
-                    "integer": "Integer",
-                    "float": "Float",
-                    "boolean": "Boolean",
-                    "datetime": "DateTime",
-                    "date": "Date"
-                }
-            }
-
-        # Загружаем пользовательскую конфигурацию если указан путь
-        if config_path:
-            if self.__is_url(config_path):
-                response = requests.get(config_path)
-                if response.ok:
-                    self._update_config(default_config, response.json(), True)
-            elif Path(config_path).exists():
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    self._update_config(default_config, json.load(f), True)
-            else:
-                warn("Конфигурационного файла не существует", UserWarning, 3)
+        # Базовые настройки для Flask-SQLAlchemy или классического SQLAlchemy
+        classic_sqlalchemy = default_config['arguments']['classic_sqlalchemy']
+        if user_config is not None:
+            classic_sqlalchemy = user_config.get('arguments', {}).get('classic_sqlalchemy', classic_sqlalchemy)
+        if getattr(self, 'classic_sqlalchemy', classic_sqlalchemy):
+            default_config["model"] = deepcopy(CLASSIC_MODEL_CONFIG)
+        else:
+            default_config["model"] = deepcopy(MODEL_CONFIG)
+        default_config["form"] = deepcopy(FORM_CONFIG)
+
+        # Применяем пользовательскую конфигурацию если она загружена
+        if user_config is not None:
+            self._update_config(default_config, user_config)
+        # Исключаемые колонки проверяются для каждой колонки таблицы
+        default_config["model"]["exclude_columns"] = frozenset(default_config["model"]["exclude_columns"])
         return default_config
 
     @staticmethod
@@ -335,215 +424,224 @@ class ModelFormGenerator:
             del arguments['output']
         return arguments
 
-    def _update_config(self, default, user, is_first: bool):
-        """Рекурсивно обновляет конфигурацию по умолчанию пользовательской"""
-        if is_first:
-            user['arguments'] = self.__fix_args_keys(user.get('arguments', {}))
-        for key, value in user.items():
-            if key in default and isinstance(default[key], dict) and isinstance(value, dict):
-                self._update_config(default[key], value, False)
-            else:
-                default[key] = value
+    def _update_config(self, default, user):
+        """Обновляет конфигурацию по умолчанию пользовательской (вложенные словари сливаются)"""
+        user['arguments'] = self.__fix_args_keys(user.get('arguments', {}))
+        stack = [(default, user)]
+        while stack:
+            default_part, user_part = stack.pop()
+            for key, value in user_part.items():
+                default_value = default_part.get(key)
+                if isinstance(default_value, dict) and isinstance(value, dict):
+                    stack.append((default_value, value))
+                else:
+                    default_part[key] = value
 
-    def _get_table_info(self):
+    def _get_table_info(self) -> ColumnsInfo:
         """Получает информацию о таблице и ее колонках"""
-        inspector = inspect(self.engine)
+        # Рефлексия выполняется один раз, модель и форма используют общий результат
+        columns_info = self._columns_info_cache.get(self.table_name)
+        if columns_info is not None:
+            return columns_info
 
         # Получаем информацию о колонках
-        columns_info = []
-        for column in inspector.get_columns(self.table_name):
-            col_info = {
-                'name': column['name'],
-                'type': type(column['type']).__name__.lower(),
-                'nullable': column['nullable'],
-                'default': column['default'],
-                'primary_key': column.get('primary_key', False),
-                'length': getattr(column['type'], 'length', None)
-            }
-            columns_info.append(col_info)
-
+        columns_info = ColumnsInfo()
+        # Таблица, отраженная через preload_metadata, берется из метаданных без запросов к БД.
+        # Остальные отражаются в отдельные метаданные: переданные могут использоваться из нескольких потоков
+        table = self.metadata.tables.get(self.table_name)
+        if table is None:
+            table = Table(self.table_name, MetaData(), autoload_with=self.engine)
+        for column in table.columns:
+            # Computed и Identity не являются значениями по умолчанию
+            default = column.server_default
+            columns_info.append(column.name, column.type, column.nullable,
+                                str(default.arg) if isinstance(default, DefaultClause) else None,
+                                column.primary_key)
+
+        self._columns_info_cache[self.table_name] = columns_info
         return columns_info
 
     def _python_type_to_sqlalchemy(self, sql_type, length=None):
         """Преобразует SQL тип в SQLAlchemy тип"""
-        type_mapping = self.config["model"]["type_mapping"]
-
-        if sql_type.startswith('varchar') or sql_type == 'string' or sql_type == 'text':
-            if self.classic_sqlalchemy:
-                return f"String({length})" if length else "String"
-            else:
-                return f"db.String({length})" if length else "db.String"
-        elif sql_type == 'integer':
-            return "Integer" if self.classic_sqlalchemy else "db.Integer"
-        elif sql_type == 'float' or sql_type == 'numeric':
-            return "Float" if self.classic_sqlalchemy else "db.Float"
-        elif sql_type == 'boolean':
-            return "Boolean" if self.classic_sqlalchemy else "db.Boolean"
-        elif sql_type == 'datetime':
-            return "DateTime" if self.classic_sqlalchemy else "db.DateTime"
-        elif sql_type == 'date':
-            return "Date" if self.classic_sqlalchemy else "db.Date"
-        elif sql_type == 'text':
-            return "Text" if self.classic_sqlalchemy else "db.Text"
-        else:
-            return "String" if self.classic_sqlalchemy else "db.String"
+        sqlalchemy_type = self._sa_type_table.get(sql_type)
+        if sqlalchemy_type:
+            return sqlalchemy_type
+        # Строковые и неизвестные типы отображаются в String
+        if length and sql_type in STRING_SQL_TYPES:
+            return f"{self._db_prefix}String({length})"
+        return f"{self._db_prefix}String"
 
     def _python_type_to_wtforms(self, sql_type):
         """Преобразует SQL тип в WTForms поле"""
-        field_mapping = self.config["form"]["field_mapping"]
-
-        if sql_type.startswith('varchar') or sql_type == 'string':
-            return field_mapping["string"]
-        elif sql_type == 'text':
-            return field_mapping["text"]
-        elif sql_type == 'integer':
-            return field_mapping["integer"]
-        elif sql_type == 'float' or sql_type == 'numeric':
-            return field_mapping["float"]
-        elif sql_type == 'boolean':
-            return field_mapping["boolean"]
-        elif sql_type == 'datetime':
-            return field_mapping["datetime"]
-        elif sql_type == 'date':
-            return field_mapping["date"]
-        else:
-            return field_mapping["string"]
+        return self._wt_type_table.get(sql_type) or self._wt_type_table['string']
 
     @staticmethod
-    def _generate_validators(column_info):
+    def _generate_validators(name: str, sql_type: str, nullable: bool, primary_key: bool, length=None):
         """Генерирует валидаторы для поля формы"""
         validators = []
 
         # Проверка на обязательность
-        if not column_info['nullable'] and not column_info['primary_key']:
+        if not nullable and not primary_key:
             validators.append("DataRequired()")
 
         # Проверка длины для строковых полей
-        if column_info['type'] in ['string', 'varchar'] and column_info.get('length'):
-            validators.append(f"Length(max={column_info['length']})")
+        if sql_type == 'string' and length:
+            validators.append(f"Length(max={length})")
 
         # Проверка email по имени поля
-        if 'email' in column_info['name'].lower():
+        if _EMAIL_RE.search(name):
             validators.append("Email()")
 
         return validators
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _to_camel_case(name):
         """Преобразует snake_case в CamelCase"""
-        return ''.join(word.capitalize() for word in name.split('_'))
-
-    def generate_model(self, class_name=None) -> Code:
-        """Генерирует код модели SQLAlchemy"""
-        if not class_name:
-            class_name = self._to_camel_case(self.table_name)
-
-        columns_info = self._get_table_info()
-
-        # Импорты
-        imports = "\n".join(self.config["model"]["imports"])
-
-        # Код модели
-        model_code = [f"{imports}\n\n"]
-
-        if not self.classic_sqlalchemy:
-            model_code.append(f"db = SQLAlchemy()\n\n\n")
-
-        model_code.append(f"class {class_name}({self.config['model']['base_class']}):\n")
-        model_code.append(f"\t__tablename__ = '{self.table_name}'\n")
-
-        for column in columns_info:
-            if column['name'] in self.config["model"]["exclude_columns"]:
-                continue
-
-            sqlalchemy_type = self._python_type_to_sqlalchemy(
-                column['type'],
-                column.get('length')
-            )
-
-            # Параметры колонки
-            params = []
-            if column['primary_key']:
-                params.append("primary_key=True")
-            if not column['nullable']:
-                params.append("nullable=False")
-            if column.get('default') is not None:
-                params.append(f"default={column['default']}")
-
-            params_str = ", ".join(params)
-
-            # Для классического SQLAlchemy используем Column вместо db.Column
-            if self.classic_sqlalchemy:
-                if params_str:
-                    model_code.append(f"\t{column['name']} = Column({sqlalchemy_type}, {params_str})\n")
-                else:
-                    model_code.append(f"\t{column['name']} = Column({sqlalchemy_type})\n")
-            else:
-                if params_str:
-                    model_code.append(f"\t{column['name']} = db.Column({sqlalchemy_type}, {params_str})\n")
-                else:
-                    model_code.append(f"\t{column['name']} = db.Column({sqlalchemy_type})\n")
-
-        model_code.append("\n    def __repr__(self):\n")
-        model_code.append(f"        return f'<{class_name} {{self.id}}>'\n")
-
-        return Code("".join(model_code), class_name)
-
-    def _translate(self, text: str):
-        if self.translate_labels:
-            if not self._translator:
-                self._translator = GoogleTranslator(source=self.label_original_language,
-                                                    target=self.translate_labels)
-            try:
-                return self._translator.translate(text)
-            except Exception:
-                return text
-        return text
-
-    def generate_form(self, class_name=None) -> Code:
-        """Генерирует код формы WTForms"""
-        if not class_name:
-            form_class_name = self._to_camel_case(self.table_name) + "Form"
-        else:
-            form_class_name = class_name
-
+        return _CAMEL_RE.sub(lambda match: match.group(1).upper(), name.lower()).replace('_', '')
+
+    def _translate_batch(self, texts: list[str]) -> dict[str, str]:
+        """Переводит все labels формы одним вызовом, возвращает словарь оригинал -> перевод"""
+        unique = list(dict.fromkeys(texts))
+        # Перевод на исходный язык ничего не меняет, запросы к API не нужны
+        if not self.translate_labels or not unique or self.translate_labels == self.label_original_language:
+            return {text: text for text in unique}
+        key = (self.label_original_language, self.translate_labels)
+        translator = self._get_translator(*key)
+        with self._translation_lock:
+            # Уже переведенные labels (например, из других таблиц) повторно не запрашиваются
+            translations = self._translation_cache.setdefault(key, {})
+            missing = [text for text in unique if text not in translations]
+        if missing:
+            # Запросы к API выполняются без блокировки, чтобы потоки не ждали друг друга
+            for chunk in _split_labels(missing, TRANSLATE_MAX_LENGTH):
+                try:
+                    # Labels отправляются одним запросом на часть, по строке на label
+                    translated = translator.translate('\n'.join(chunk)).split('\n')
+                    if len(translated) != len(chunk):
+                        translated = translator.translate_batch(chunk)
+                except Exception:
+                    # Labels этой части остаются без перевода
+                    continue
+                with self._translation_lock:
+                    translations.update((text, result.strip() or text) for text, result in zip(chunk, translated))
+        with self._translation_lock:
+            return {text: translations.get(text, text) for text in unique}
+
+    def _prepare_columns(self, model: bool = True, form: bool = True) -> tuple[list[dict], list[dict]]:
+        """За один проход по колонкам готовит данные для шаблонов модели и/или формы"""
+        exclude_columns = self.config["model"]["exclude_columns"]
+
+        # Шаблоны только подставляют готовые значения, вся логика выполняется здесь
+        model_columns = []
+        form_fields = []
         columns_info = self._get_table_info()
-
-        # Импорты
-        imports = "\n".join(self.config["form"]["imports"])
-
-        # Код формы
-        form_code = [f"{imports}\n\n\n", f"class {form_class_name}({self.config['form']['base_class']}):\n"]
-
-        for column in columns_info:
-            if column['name'] in self.config["model"]["exclude_columns"] or column['primary_key']:
+        # Типы отображаются по столбцам ColumnsInfo целиком, а не поштучно для каждой записи
+        sa_types = [self._python_type_to_sqlalchemy(sql_type, length)
+                    for sql_type, length in zip(columns_info.types, columns_info.lengths)] if model else None
+        wt_types = [self._python_type_to_wtforms(sql_type) for sql_type in columns_info.types] if form else None
+        for i, (name, sql_type, nullable, default, primary_key, length) in enumerate(columns_info):
+            if name in exclude_columns:
                 continue
 
-            field_type = self._python_type_to_wtforms(column['type'])
-            validators = self._generate_validators(column)
-
-            # Лейбл поля (преобразуем snake_case в Normal Case)
-            label_text = column['name'].replace('_', ' ').title()
-            label = self._translate(label_text)
+            if model:
+                # Параметры колонки одной строкой, без промежуточного списка
+                params = ", ".join(param for param in (
+                    primary_key and "primary_key=True",
+                    not nullable and "nullable=False",
+                    default is not None and f"default={default}",
+                ) if param)
+
+                model_columns.append({
+                    'name': name,
+                    'type': sa_types[i],
+                    'params': params
+                })
+
+            if form and not primary_key:
+                form_fields.append({
+                    'name': name,
+                    'type': wt_types[i],
+                    # Лейбл поля (преобразуем snake_case в Normal Case)
+                    'label': name.replace('_', ' ').title(),
+                    'validators': self._generate_validators(name, sql_type, nullable, primary_key, length)
+                })
+
+        # Все колонки формы исключены, переводить нечего
+        if not form_fields:
+            return model_columns, form_fields
+
+        # Лейблы переводим одним пакетом
+        translations = self._translate_batch([form_field['label'] for form_field in form_fields])
+        for form_field in form_fields:
+            form_field['label'] = translations[form_field['label']]
             if self.colon_to_labels:
-                label += ':'
+                form_field['label'] += ':'
 
-            # Параметры поля
-            if validators:
-                validators_str = ", ".join(validators)
-                form_code.append(f"\t{column['name']} = {field_type}('{label}', validators=[{validators_str}])\n")
-            else:
-                form_code.append(f"\t{column['name']} = {field_type}('{label}')\n")
+        return model_columns, form_fields
 
-        if self.submit is not None:
-            form_code.append(f"    submit = SubmitField(\"{self.submit}\")\n")
-        meta = self.config["form"]["meta"]
-        if meta:
-            form_code.append('\n    class Meta:\n')
-            for key, value in meta.items():
-                form_code.append(f'\t\t{key} = {value}\n')
+    def _warn_empty_classes(self, columns: Optional[list[dict]] = None, fields: Optional[list[dict]] = None,
+                            stacklevel: int = 2):
+        """Предупреждает о пустых модели и форме. stacklevel отсчитывается от публичного метода, как в warn()"""
+        if columns is not None and not columns:
+            warn(f"В таблице {self.table_name} нет колонок для модели", EmptyClassWarning, stacklevel + 1)
+        if fields is not None and not fields:
+            warn(f"В таблице {self.table_name} нет колонок для формы", EmptyClassWarning, stacklevel + 1)
 
-        return Code("".join(form_code), form_class_name)
+    def _render_model(self, class_name, columns: list[dict], out: Optional[TextIO] = None) -> Optional[Code]:
+        """Рендерит шаблон модели по подготовленным колонкам"""
+        if not class_name:
+            class_name = self._to_camel_case(self.table_name)
+
+        model_stream = self._model_template.stream(
+            imports="\n".join(self.config["model"]["imports"]),
+            classic=self.classic_sqlalchemy,
+            column_class=self._db_prefix + 'Column',
+            class_name=class_name,
+            base_class=self.config['model']['base_class'],
+            table_name=self.table_name,
+            columns=columns
+        )
+        if out is not None:
+            model_stream.dump(out)
+            return None
+
+        buffer = StringIO()
+        model_stream.dump(buffer)
+        return Code(buffer.getvalue(), class_name)
+
+    def _render_form(self, class_name, fields: list[dict], out: Optional[TextIO] = None) -> Optional[Code]:
+        """Рендерит шаблон формы по подготовленным полям"""
+        if not class_name:
+            class_name = self._to_camel_case(self.table_name) + "Form"
+
+        form_stream = self._form_template.stream(
+            imports="\n".join(self.config["form"]["imports"]),
+            class_name=class_name,
+            base_class=self.config['form']['base_class'],
+            fields=fields,
+            submit=self.submit,
+            meta=self.config["form"]["meta"]
+        )
+        if out is not None:
+            form_stream.dump(out)
+            return None
+
+        buffer = StringIO()
+        form_stream.dump(buffer)
+        return Code(buffer.getvalue(), class_name)
+
+    def generate_model(self, class_name=None, out: Optional[TextIO] = None) -> Optional[Code]:
+        """Генерирует код модели SQLAlchemy. Если передан out, код пишется в него по частям и возвращается None"""
+        columns, _ = self._prepare_columns(form=False)
+        self._warn_empty_classes(columns=columns)
+        return self._render_model(class_name, columns, out)
+
+    def generate_form(self, class_name=None, out: Optional[TextIO] = None) -> Optional[Code]:
+        """Генерирует код формы WTForms. Если передан out, код пишется в него по частям и возвращается None"""
+        _, fields = self._prepare_columns(model=False)
+        self._warn_empty_classes(fields=fields)
+        return self._render_form(class_name, fields, out)
 
     def __database_label(self):
         url = self.database_url
@@ -555,8 +653,8 @@ class ModelFormGenerator:
             label = "URL базы данных: "
         return label + path
 
-    def generate_file(self):
-        """Генерирует файл с моделью и/или формой"""
+    def generate_file(self, stacklevel: int = 2):
+        """Генерирует файл с моделью и/или формой. stacklevel указывает, к чьему вызову относятся предупреждения"""
         if self.default_rename:
             model_class_name = "Model"
             form_class_name = "Form"
@@ -568,45 +666,46 @@ class ModelFormGenerator:
         form_code = ''
         all_list = list()
 
-        # Генерируем только то, что нужно
+        # Генерируем только то, что нужно, модель и форма готовятся за один проход по колонкам
+        columns, fields = self._prepare_columns(model=not self.only_form, form=not self.only_model)
+        self._warn_empty_classes(None if self.only_form else columns, None if self.only_model else fields, stacklevel)
         if not self.only_form:
-            model_code, model_class = self.generate_model(model_class_name)
+            model_code, model_class = self._render_model(model_class_name, columns)
             all_list.append(model_class)
-
         if not self.only_model:
-            form_code, form_class = self.generate_form(form_class_name)
+            form_code, form_class = self._render_form(form_class_name, fields)
             all_list.append(form_class)
 
         if self.add_db_to_all:
             all_list.append('db')
 
         if self.output_path:
-            if Path(self.output_path).is_file():
+            if not self.ignore_and_rewrite and Path(self.output_path).is_file():
                 with open(self.output_path, encoding='utf-8') as file:
-                    if file.read().startswith(self.__NON_REWRITABLE_DECORATOR) and not self.ignore_and_rewrite:
+                    # Для проверки метки достаточно прочитать только начало файла
+                    if file.read(len(self.__NON_REWRITABLE_DECORATOR)) == self.__NON_REWRITABLE_DECORATOR:
                         raise RuntimeError("Данный файл отмечен как неперезаписываемый")
-            with open(self.output_path, 'w', encoding='utf-8') as file:
-                if self.non_rewritable:
-                    file.write(self.__NON_REWRITABLE_DECORATOR)
-                file.write(f"# Файл сгенерирован db-model-generator {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}\n")
-                file.write(f'# {self.__database_label()}\n')
-                file.write(f"# Название таблицы: {self.table_name}\n\n")
-                file.write(f'__all__ = {all_list}\n\n')
-                if model_code:
-                    file.write("# Модель SQLAlchemy\n")
-                    if not self.tab:
-                        file.write(tab4(model_code))
-                    else:
-                        file.write(model_code)
-                    if form_code:
-                        file.write("\n\n")
-
+            if not self.tab:
+                from tab4 import tab4
+
+            # Содержимое файла собирается целиком и записывается одним вызовом
+            parts = []
+            if self.non_rewritable:
+                parts.append(self.__NON_REWRITABLE_DECORATOR)
+            parts.append(f"# Файл сгенерирован db-model-generator {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}\n"
+                         f"# {self.__database_label()}\n"
+                         f"# Название таблицы: {self.table_name}\n\n"
+                         f"__all__ = {all_list}\n\n")
+            if model_code:
+                parts.append("# Модель SQLAlchemy\n")
+                parts.append(model_code if self.tab else tab4(model_code))
                 if form_code:
-                    file.write("# Форма WTForms\n")
-                    if not self.tab:
-                        file.write(tab4(form_code))
-                    else:
-                        file.write(form_code)
+                    parts.append("\n\n")
+
+            if form_code:
+                parts.append("# Форма WTForms\n")
+                parts.append(form_code if self.tab else tab4(form_code))
+            Path(self.output_path).write_text("".join(parts), encoding='utf-8')
 
             self.log(f"Файл создан: {self.output_path}")
 
@@ -4,24 +4,29 @@
 на основе таблиц базы данных.
 """
 
-import argparse, sys, warnings, traceback
-from typing import Union
+import sys, warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Union, Iterable
 from pyundefined import UndefinedType, undefined
+from sqlalchemy import MetaData
 from db_model_generator.constants import LANGUAGES_RU as LANGUAGES
-from db_model_generator.core import ModelFormGenerator
+from db_model_generator.core import ModelFormGenerator, check_database_url, preload_metadata
 from db_model_generator.typings import PathLikeOrNone, Optional, LanguageCodeType, NullStr
 from db_model_generator.warnings import ExtraKwargsWarning
 
-__all__ = ['generate']
+__all__ = ['generate', 'generate_many']
 
 DEBUG = True
 
 
 def translate_validator(language_code: str) -> str:
+    from argparse import ArgumentTypeError
+
     if not isinstance(language_code, str):
-        raise argparse.ArgumentTypeError("Language code must be a string")
+        raise ArgumentTypeError("Language code must be a string")
     elif language_code not in LANGUAGES.keys():
-        raise argparse.ArgumentTypeError(f"Language code {language_code} is not supported")
+        raise ArgumentTypeError(f"Language code {language_code} is not supported")
     return language_code
 
 
@@ -34,7 +39,8 @@ def generate(*, database: PathLikeOrNone, table_name: str, output: PathLikeOrNon
              log_mode: bool = False, env: Union[PathLikeOrNone, UndefinedType] = None,
              submit: NullStr = None, non_rewritable: bool = False, add_db_to_all: bool = False,
              ignore_and_rewrite: bool = False, debug: bool = False,
-             colon_to_labels: bool = False, **kwargs) -> None:
+             colon_to_labels: bool = False, output_dir: PathLikeOrNone = None,
+             metadata: Optional[MetaData] = None, **kwargs) -> None:
     """
    Генерирует модели SQLAlchemy и формы WTForms на основе таблицы базы данных.
 
@@ -76,6 +82,10 @@ def generate(*, database: PathLikeOrNone, table_name: str, output: PathLikeOrNon
    :type non_rewritable: bool
    :param colon_to_labels: Добавить двоеточие в конце labels формы
    :type colon_to_labels: bool
+   :param output_dir: Папка для выходного файла с именем по умолчанию, если output не указан
+   :type output_dir: str или None
+   :param metadata: Метаданные, заранее отраженные через preload_metadata
+   :type metadata: MetaData или None
 
    :raises ValueError: Если не указаны обязательные параметры database или table_name
    :raises ConnectionError: Если не удается подключиться к указанной базе данных
@@ -106,15 +116,66 @@ def generate(*, database: PathLikeOrNone, table_name: str, output: PathLikeOrNon
             non_rewritable=non_rewritable,
             ignore_and_rewrite=ignore_and_rewrite,
             add_db_to_all=add_db_to_all,
-            colon_to_labels=colon_to_labels
+            colon_to_labels=colon_to_labels,
+            output_dir=output_dir,
+            metadata=metadata
         )
-        generator.generate_file()
+        # Предупреждения генератора относятся к коду, вызвавшему generate()
+        generator.generate_file(stacklevel=3)
+    except Exception as e:
+        _handle_error(e, debug)
+
+
+def generate_many(*, database: str, table_names: Iterable[str], output_dir: PathLikeOrNone = None,
+                  debug: bool = False, max_workers: int = 8, **kwargs) -> None:
+    """
+   Генерирует модели и формы для нескольких таблиц одной базы данных.
+   Все таблицы отражаются одним запросом, затем для каждой в отдельном потоке вызывается generate().
+
+   :param database: URL базы данных для подключения
+   :type database: str
+   :param table_names: Имена таблиц для генерации
+   :type table_names: Iterable[str]
+   :param output_dir: Папка для выходных файлов, имена файлов такие же, как у generate() без output
+   :type output_dir: str или None
+   :param debug: Включить режим отладки
+   :type debug: bool
+   :param max_workers: Число потоков генерации
+   :type max_workers: int
+   :param kwargs: Остальные параметры generate()
+    """
+
+    table_names = list(table_names)
+    # Имя таблицы и выходной файл задаются для каждой таблицы отдельно
+    conflicts = sorted({'table_name', 'output', 'metadata'} & kwargs.keys())
+    if conflicts:
+        _handle_error(TypeError(f"generate_many() не принимает аргументы: {', '.join(conflicts)}"), debug)
+    try:
+        # Отражение видно только генераторам этого вызова и не устаревает между вызовами
+        metadata = preload_metadata(check_database_url(database), table_names)
     except Exception as e:
-        if debug:
-            raise e
-        else:
-            print(f"Ошибка {e.__class__.__name__}: {e}", file=sys.stderr)
-        sys.exit(1)
+        _handle_error(e, debug)
+    if not table_names:
+        return
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Таблицы уже отражены, потоки ждут только перевода labels и записи файлов
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(table_names))) as executor:
+        futures = [
+            executor.submit(generate, database=database, table_name=table_name, output_dir=output_dir,
+                            metadata=metadata, debug=debug, **kwargs)
+            for table_name in table_names
+        ]
+    for future in futures:
+        future.result()
+
+
+def _handle_error(error: Exception, debug: bool):
+    if debug:
+        raise error
+    else:
+        print(f"Ошибка {error.__class__.__name__}: {error}", file=sys.stderr)
+    sys.exit(1)
 
 
 def all_langs(arg: bool):
@@ -126,6 +187,7 @@ def all_langs(arg: bool):
 
 
 def main():
+    import argparse
     from db_model_generator import __version__
 
     warnings.filterwarnings("ignore", category=ExtraKwargsWarning)
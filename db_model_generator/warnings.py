@@ -4,3 +4,7 @@ class MeaninglessArgumentWarning(Warning):
 
 class ExtraKwargsWarning(Warning):
     pass
+
+
+class EmptyClassWarning(Warning):
+    pass
@@ -26,6 +26,7 @@ setup(
     name='db-model-generator',
     version='1.5.1',
     packages=find_packages(),
+    package_data={'db_model_generator': ['templates/*.jinja']},
     author="Маг Ильяс DOMA (MagIlyasDOMA)",
     author_email='magilyas.doma.09@list.ru',
     description="Генератор моделей sqlalchemy из таблиц базы данных",
@@ -59,7 +60,8 @@ setup(
         "python-dotenv>=1.0.0",
         "undefined-python>=1.0.0",
         "typing-extensions>=4.0.0; python_version<'3.8'",
-        "requests>=2.0.0"
+        "requests>=2.0.0",
+        "jinja2>=3.0.0"
     ],
     python_requires='>=3.10',
     extras_require={
@@ -70,7 +72,8 @@ setup(
             "python-dotenv>=1.0.0",
             "undefined-python>=1.1.0",
             "typing-extensions>=4.0.0; python_version<'3.8'",
-            "requests>=2.0.0"
+            "requests>=2.0.0",
+            "jinja2>=3.0.0"
         ],
         'flask': [
             "sqlalchemy==2.0.44",
@@ -80,6 +83,7 @@ setup(
             "undefined-python>=1.1.0",
             "typing-extensions>=4.0.0; python_version<'3.8'",
             "requests>=2.0.0",
+            "jinja2>=3.0.0",
             "flask>=3.1.1,<4.0.0",
             "flask-sqlalchemy==3.1.1",
             "flask-wtf==1.2.2",
@@ -93,6 +97,7 @@ setup(
             "undefined-python>=1.1.0",
             "typing-extensions>=4.0.0; python_version<'3.8'",
             "requests>=2.0.0",
+            "jinja2>=3.0.0",
             "flask>=3.1.1,<4.0.0",
             "flask-sqlalchemy==3.1.1",
             "flask-wtf==1.2.2",